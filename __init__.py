@@ -2,11 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pyads
 import voluptuous as vol
 import yaml
 from homeassistant.config_entries import ConfigEntry
@@ -15,6 +15,7 @@ from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.reload import async_setup_reload_service
+from homeassistant.helpers.storage import Store
 
 from .const import (
     CONF_AMS_NET_ID,
@@ -23,15 +24,33 @@ from .const import (
     CONF_PORT,
     DOMAIN,
     ENTITY_TYPES,
+    NUMBER_MODES,
     RECONNECT_BACKOFF_FACTOR,
     RECONNECT_INITIAL_DELAY,
     RECONNECT_MAX_DELAY,
+    YAML_CACHE_STORAGE_KEY,
+    YAML_CACHE_STORAGE_VERSION,
     YAML_CONFIG_FILE,
 )
-from .hub import BeckhoffADSHub
+from .connection import CONN_CACHE
+
+if TYPE_CHECKING:
+    from .hub import BeckhoffADSHub
+
+# Prefer the libyaml C loader when available
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validated YAML configuration, keyed by (path, mtime_ns, size) of the file
+_YAML_CACHE: dict[tuple[str, int, int], dict[str, Any]] = {}
+
+# Validated YAML configuration, keyed by a digest of the file content
+_YAML_DIGEST_CACHE: dict[str, dict[str, Any]] = {}
+
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.NUMBER,
@@ -55,13 +74,56 @@ ENTITY_SCHEMA = vol.Schema({
     vol.Optional("factor", default=1.0): vol.Coerce(float),  # Scaling factor
     vol.Optional("offset", default=0.0): vol.Coerce(float),  # Offset
     vol.Optional("precision", default=None): vol.Any(None, vol.Coerce(int)),  # Decimal places
+    vol.Optional("deadband", default=0.0): vol.All(vol.Coerce(float), vol.Range(min=0)),  # Notification deadband
     # Number-specific options
     vol.Optional("min_value", default=0): vol.Coerce(float),  # Minimum value
     vol.Optional("max_value", default=100): vol.Coerce(float),  # Maximum value
     vol.Optional("step", default=1): vol.Coerce(float),  # Step size
-    vol.Optional("mode", default="slider"): vol.In(["slider", "box"]),  # UI mode
+    vol.Optional("mode", default="slider"): vol.In(NUMBER_MODES),  # UI mode
 })
 
+# Version of the validated config stored in the YAML cache, bump whenever
+# ENTITY_SCHEMA or its defaults change
+YAML_CACHE_SCHEMA_VERSION = 1
+
+# Defaults applied by ENTITY_SCHEMA, used by the validation fast path
+_ENTITY_DEFAULTS: dict[str, Any] = {
+    "options": [],
+    "scan_interval": 5,
+    "use_notifications": True,
+    "plc_type": "REAL",
+    "factor": 1.0,
+    "offset": 0.0,
+    "precision": None,
+    "deadband": 0.0,
+    "min_value": 0.0,
+    "max_value": 100.0,
+    "step": 1.0,
+    "mode": "slider",
+}
+
+# Exact value types accepted by the fast path
+_ENTITY_FAST_TYPES: dict[str, type | tuple[type, ...]] = {
+    "name": str,
+    "type": str,
+    "plc_address": str,
+    "unit_of_measurement": str,
+    "device_class": str,
+    "icon": str,
+    "options": list,
+    "scan_interval": int,
+    "use_notifications": bool,
+    "plc_type": str,
+    "factor": float,
+    "offset": float,
+    "precision": (int, type(None)),
+    "deadband": float,
+    "min_value": float,
+    "max_value": float,
+    "step": float,
+    "mode": str,
+}
+
 CONFIG_SCHEMA = vol.Schema({
     DOMAIN: vol.Schema({
         vol.Required(CONF_ENTITIES, default=[]): vol.All(cv.ensure_list, [ENTITY_SCHEMA])
@@ -69,6 +131,35 @@ CONFIG_SCHEMA = vol.Schema({
 }, extra=vol.ALLOW_EXTRA)
 
 
+def _validate_entity_fast(entity_config: dict[str, Any]) -> dict[str, Any]:
+    """Validate an entity, skipping voluptuous when values are already typed."""
+    if not isinstance(entity_config, dict):
+        return ENTITY_SCHEMA(entity_config)
+    
+    config = dict(_ENTITY_DEFAULTS)
+    config.update(entity_config)
+    
+    for key, value in config.items():
+        expected = _ENTITY_FAST_TYPES.get(key)
+        if expected is None or type(value) not in (
+            expected if isinstance(expected, tuple) else (expected,)
+        ):
+            return ENTITY_SCHEMA(entity_config)
+    
+    if (
+        "name" not in config
+        or "plc_address" not in config
+        or config.get("type") not in ENTITY_TYPES
+        or config["mode"] not in NUMBER_MODES
+        or config["scan_interval"] <= 0
+        or config["deadband"] < 0
+        or any(type(option) is not str for option in config["options"])
+    ):
+        return ENTITY_SCHEMA(entity_config)
+    
+    return config
+
+
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     """Set up the Beckhoff ADS integration."""
     hass.data.setdefault(DOMAIN, {})
@@ -79,9 +170,17 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     # Register custom reload service for YAML configuration
     async def reload_yaml_config(call: ServiceCall) -> None:
         """Reload YAML configuration."""
-        # Reload all config entries for this domain
+        entities_config = (await _load_yaml_config(hass)).get(CONF_ENTITIES, [])
+        
+        # Apply the changed entities to running hubs, keeping the connection
+        # and the notifications of unchanged variables
         for entry in hass.config_entries.async_entries(DOMAIN):
-            await hass.config_entries.async_reload(entry.entry_id)
+            hub = hass.data[DOMAIN].get(entry.entry_id)
+            if hub is None:
+                # Not set up, e.g. the PLC was unreachable
+                await hass.config_entries.async_reload(entry.entry_id)
+                continue
+            await hub.async_update_entities_config(entities_config)
     
     hass.services.async_register(DOMAIN, "reload_yaml", reload_yaml_config)
     
@@ -90,6 +189,9 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Beckhoff ADS from a config entry."""
+    # The hub loads pyads, deferred so the config flow doesn't need it
+    from .hub import BeckhoffADSHub
+
     host = entry.data[CONF_HOST]
     port = entry.data[CONF_PORT]
     ams_net_id = entry.data[CONF_AMS_NET_ID]
@@ -99,7 +201,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     entities_config = yaml_config.get(CONF_ENTITIES, [])
     
     # Create and setup hub
-    hub = BeckhoffADSHub(hass, host, port, ams_net_id, entities_config)
+    hub = BeckhoffADSHub(
+        hass,
+        host,
+        port,
+        ams_net_id,
+        entities_config,
+        existing_conn=CONN_CACHE.pop((host, ams_net_id, port), None),
+    )
     
     try:
         await hub.async_setup()
@@ -130,24 +239,116 @@ async def _load_yaml_config(hass: HomeAssistant) -> dict[str, Any]:
     """Load configuration from YAML file."""
     config_path = hass.config.path(YAML_CONFIG_FILE)
     
-    if not os.path.isfile(config_path):
-        _LOGGER.debug("YAML config file not found: %s", config_path)
-        return {}
+    # Stat, read and hash in a single executor job, keeping the file system
+    # off the event loop
+    def read_yaml_file() -> (
+        tuple[tuple[str, int, int], bytes | None, str | None] | None
+    ):
+        try:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
+            return None
+        
+        # Skip reading while the file is unchanged
+        cache_key = (config_path, stat.st_mtime_ns, stat.st_size)
+        if cache_key in _YAML_CACHE:
+            return cache_key, None, None
+        
+        # A touched but unchanged file still has the same content digest
+        with open(config_path, "rb") as file:
+            data = file.read()
+        return cache_key, data, hashlib.blake2b(data, digest_size=16).hexdigest()
     
     try:
-        # Use async file reading to avoid blocking
-        def read_yaml_file():
-            with open(config_path, encoding="utf-8") as file:
-                return yaml.safe_load(file) or {}
+        file_info = await hass.async_add_executor_job(read_yaml_file)
+        if file_info is None:
+            _LOGGER.debug("YAML config file not found: %s", config_path)
+            return {}
         
-        config = await hass.async_add_executor_job(read_yaml_file)
-            
-        # Validate configuration
-        if DOMAIN in config:
-            config[DOMAIN] = CONFIG_SCHEMA({DOMAIN: config[DOMAIN]})[DOMAIN]
-            return config[DOMAIN]
-            
+        cache_key, data, digest = file_info
+        if data is None:
+            if (cached := _YAML_CACHE.get(cache_key)) is not None:
+                return cached
+            # Replaced by a concurrent load in the meantime
+            return await _load_yaml_config(hass)
+        
+        validated = _YAML_DIGEST_CACHE.get(digest)
+        if validated is None:
+            validated = await _async_load_yaml_cache(hass, digest)
+        if validated is None:
+            validated = await hass.async_add_executor_job(_parse_yaml_config, data)
+            await _async_save_yaml_cache(hass, digest, validated)
     except Exception as err:
         _LOGGER.error("Error loading YAML config: %s", err)
+        return {}
+    
+    _YAML_CACHE.clear()
+    _YAML_CACHE[cache_key] = validated
+    _YAML_DIGEST_CACHE.clear()
+    _YAML_DIGEST_CACHE[digest] = validated
+    return validated
+
+
+def _parse_yaml_config(data: bytes) -> dict[str, Any]:
+    """Parse and validate the YAML configuration."""
+    # libyaml decodes the UTF-8 bytes itself
+    return _validate_config(yaml.load(data, Loader=_YamlLoader) or {})
+
+
+def _validate_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Validate the integration section of the YAML configuration."""
+    if DOMAIN not in config:
+        return {}
+    
+    domain_config = config[DOMAIN]
+    if not isinstance(domain_config, dict) or set(domain_config) - {CONF_ENTITIES}:
+        # Let the full schema report what is wrong
+        return CONFIG_SCHEMA({DOMAIN: domain_config})[DOMAIN]
     
-    return {}
\ No newline at end of file
+    return {
+        CONF_ENTITIES: [
+            _validate_entity_fast(entity_config)
+            for entity_config in cv.ensure_list(
+                domain_config.get(CONF_ENTITIES, [])
+            )
+        ],
+    }
+
+
+async def _async_load_yaml_cache(
+    hass: HomeAssistant, digest: str
+) -> dict[str, Any] | None:
+    """Return the cached validated config if it matches the YAML content."""
+    store: Store[dict[str, Any]] = Store(
+        hass, YAML_CACHE_STORAGE_VERSION, YAML_CACHE_STORAGE_KEY
+    )
+    try:
+        cached = await store.async_load()
+    except Exception as err:
+        _LOGGER.debug("Error reading YAML config cache: %s", err)
+        return None
+    
+    if (
+        not isinstance(cached, dict)
+        or cached.get("schema_version") != YAML_CACHE_SCHEMA_VERSION
+        or cached.get("digest") != digest
+    ):
+        return None
+    return cached.get("config")
+
+
+async def _async_save_yaml_cache(
+    hass: HomeAssistant, digest: str, config: dict[str, Any]
+) -> None:
+    """Store the validated config for the next start."""
+    store: Store[dict[str, Any]] = Store(
+        hass, YAML_CACHE_STORAGE_VERSION, YAML_CACHE_STORAGE_KEY
+    )
+    try:
+        await store.async_save({
+            "schema_version": YAML_CACHE_SCHEMA_VERSION,
+            "digest": digest,
+            "config": config,
+        })
+    except Exception as err:
+        _LOGGER.debug("Error writing YAML config cache: %s", err)
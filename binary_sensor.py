@@ -25,11 +25,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up binary sensor entities from config entry."""
     hub: BeckhoffADSHub = hass.data[DOMAIN][config_entry.entry_id]
+    hub.async_register_platform("binary_sensor", BeckhoffADSBinarySensor, async_add_entities)
     
-    entities = []
-    for entity_config in hub.entities_config:
-        if entity_config.get("type") == "binary_sensor":
-            entities.append(BeckhoffADSBinarySensor(hub, entity_config))
+    entities = [
+        BeckhoffADSBinarySensor(hub, entity_config)
+        for entity_config in hub.configs_for("binary_sensor")
+    ]
     
     async_add_entities(entities)
 
@@ -49,22 +50,3 @@ class BeckhoffADSBinarySensor(BeckhoffADSEntity, BinarySensorEntity):
     def _process_notification_value(self, value: Any) -> None:
         """Process notification value."""
         self._attr_is_on = bool(value)
-
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        if not self._hub.connected:
-            self._attr_available = False
-            return
-
-        try:
-            value = await self._hub.async_read_value(
-                self._plc_address, pyads.PLCTYPE_BOOL
-            )
-            self._attr_is_on = bool(value)
-            self._attr_available = True
-            
-        except Exception as err:
-            # Don't log every error, only when availability changes
-            if self._attr_available:
-                _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
-            self._attr_available = False
\ No newline at end of file
@@ -4,12 +4,12 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import pyads
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PORT
 from homeassistant.data_entry_flow import FlowResult
 
+from .connection import CONN_CACHE
 from .const import CONF_AMS_NET_ID, DEFAULT_PORT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -37,6 +37,10 @@ class BeckhoffADSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             port = user_input[CONF_PORT]
             ams_net_id = user_input[CONF_AMS_NET_ID]
 
+            # Abort before opening a connection that would not be used
+            await self.async_set_unique_id(f"{host}_{ams_net_id}")
+            self._abort_if_unique_id_configured()
+
             # Test connection
             try:
                 await self._test_connection(host, port, ams_net_id)
@@ -47,9 +51,6 @@ class BeckhoffADSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
             else:
                 # Create entry
-                await self.async_set_unique_id(f"{host}_{ams_net_id}")
-                self._abort_if_unique_id_configured()
-
                 return self.async_create_entry(
                     title=f"Beckhoff PLC ({host})",
                     data=user_input,
@@ -62,12 +63,25 @@ class BeckhoffADSConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def _test_connection(self, host: str, port: int, ams_net_id: str) -> None:
-        """Test connection to PLC."""
+        """Test connection to PLC.
+        
+        The open connection is kept for the hub set up right after the entry
+        is created, saving a second connection handshake.
+        """
+        # Only load the native ADS library once a connection is tested
+        import pyads
+
+        key = (host, ams_net_id, port)
+        plc = CONN_CACHE.pop(key, None) or pyads.Connection(ams_net_id, port, host)
         try:
-            plc = pyads.Connection(ams_net_id, port, host)
-            await self.hass.async_add_executor_job(plc.open)
+            if not plc.is_open:
+                await self.hass.async_add_executor_job(plc.open)
             await self.hass.async_add_executor_job(plc.read_state)
-            await self.hass.async_add_executor_job(plc.close)
         except Exception as err:
             _LOGGER.error("Connection test failed: %s", err)
+            try:
+                await self.hass.async_add_executor_job(plc.close)
+            except Exception:
+                pass
             raise ConnectionError from err
+        CONN_CACHE[key] = plc
@@ -0,0 +1,11 @@
+"""Connections shared between the config flow and the hub."""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyads
+
+# Connections opened by the config flow, handed over to the hub on setup.
+# Imported by the config flow, so it must not load pyads itself.
+CONN_CACHE: dict[tuple[str, str, int], pyads.Connection] = {}
@@ -1,4 +1,5 @@
 """Constants for the Beckhoff ADS integration."""
+from types import MappingProxyType
 
 DOMAIN = "beckhoff_ads"
 
@@ -13,13 +14,26 @@ DEFAULT_PORT = 851
 DEFAULT_SCAN_INTERVAL = 5  # seconds
 
 # Entity types
-ENTITY_TYPES = [
+ENTITY_TYPES = frozenset({
     "binary_sensor",
     "number",
-    "select", 
+    "select",
     "sensor",
-    "switch"
-]
+    "switch",
+})
+
+# Number entity UI modes
+NUMBER_MODES = frozenset({"slider", "box"})
+
+# Entities added within this window get their initial value in one request
+INITIAL_UPDATE_DELAY = 0.1  # seconds
+
+# Notifications arriving within this window are coalesced per variable
+NOTIFICATION_DEBOUNCE = 0.05  # seconds
+
+# Healthy connections are probed at this interval, refreshing variables
+# updated by notifications, which the PLC can drop without an error
+LIVENESS_CHECK_INTERVAL = 30  # seconds
 
 # Reconnection settings
 RECONNECT_INITIAL_DELAY = 5  # seconds
@@ -29,8 +43,12 @@ RECONNECT_BACKOFF_FACTOR = 2
 # YAML configuration file name
 YAML_CONFIG_FILE = "beckhoff_ads.yaml"
 
+# Storage key and version of the validated YAML configuration cache
+YAML_CACHE_STORAGE_KEY = "beckhoff_ads.yaml_config"
+YAML_CACHE_STORAGE_VERSION = 1
+
 # Supported PLC data types for sensors
-SENSOR_DATA_TYPES = {
+SENSOR_DATA_TYPES = MappingProxyType({
     "BOOL": "pyads.PLCTYPE_BOOL",
     "BYTE": "pyads.PLCTYPE_BYTE", 
     "SINT": "pyads.PLCTYPE_SINT",
@@ -48,4 +66,4 @@ SENSOR_DATA_TYPES = {
     "DATE": "pyads.PLCTYPE_DATE", 
     "DT": "pyads.PLCTYPE_DT",
     "TOD": "pyads.PLCTYPE_TOD"
-}
\ No newline at end of file
+})
\ No newline at end of file
@@ -3,37 +3,76 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import timedelta
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import async_track_time_interval
 
-from .hub import BeckhoffADSHub
+from .hub import PLC_ERRORS, BeckhoffADSHub
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marker for entities that did not handle a value yet
+_UNSET = object()
+
+
+def _identity(value: float) -> float:
+    """Return an already scaled value."""
+    return value
+
+
+@lru_cache(maxsize=128)
+def build_scaler(
+    factor: float, offset: float, precision: int | None, is_float: bool = False
+) -> Callable[[Any], float]:
+    """Return the scaling of numeric PLC values, shared by equal options.
+    
+    REAL and LREAL values (is_float) are floats already and skip the
+    conversion.
+    """
+    if factor == 1 and offset == 0:
+        if precision is None:
+            return _identity if is_float else float
+        if is_float:
+            return lambda value: round(value, precision)
+        return lambda value: round(float(value), precision)
+    if is_float:
+        if precision is None:
+            return lambda value: value * factor + offset
+        return lambda value: round(value * factor + offset, precision)
+    if precision is None:
+        return lambda value: float(value) * factor + offset
+    return lambda value: round(float(value) * factor + offset, precision)
+
 
 class BeckhoffADSEntity(Entity):
     """Base class for Beckhoff ADS entities."""
 
     def __init__(self, hub: BeckhoffADSHub, config: dict[str, Any]) -> None:
         """Initialize the entity."""
+        get = config.get
         self._hub = hub
         self._config = config
         self._plc_address = config["plc_address"]
-        self._scan_interval = config.get("scan_interval", 5)
+        self._scan_interval = get("scan_interval", 5)
         
         # Entity attributes
         self._attr_name = config["name"]
-        self._attr_unique_id = f"{hub.host}_{hub.ams_net_id}_{config['plc_address']}"
-        self._attr_icon = config.get("icon")
+        self._attr_unique_id = hub.unique_id_prefix + self._plc_address
+        self._attr_icon = get("icon")
         self._attr_available = False
+        # The hub polls entities in batches, Home Assistant doesn't need to
+        self._attr_should_poll = False
         
         # Notification support
-        self._use_notifications = config.get("use_notifications", True)
+        self._use_notifications = get("use_notifications", True)
         self._notification_handle = None
         
+        # Last handled raw value and the state it resulted in
+        self._last_value: Any = _UNSET
+        self._last_state: tuple[Any, ...] | None = None
+        
         # Register with hub
         self._hub.register_entity(self)
         self._remove_update_listener = None
@@ -44,15 +83,10 @@ class BeckhoffADSEntity(Entity):
         if self._use_notifications:
             await self._async_setup_notification()
         
-        # Schedule regular updates as fallback
-        self._remove_update_listener = async_track_time_interval(
-            self.hass,
-            self._async_update_wrapper,
-            timedelta(seconds=self._scan_interval)
-        )
-        
-        # Initial update
-        await self.async_update()
+        # Schedule regular updates as fallback, batched with entities sharing
+        # the same scan interval. The hub also reads the initial value,
+        # together with all entities added at the same time.
+        self._remove_update_listener = self._hub.async_track_poll(self)
 
     async def _async_setup_notification(self) -> None:
         """Setup ADS notification for this entity."""
@@ -60,13 +94,17 @@ class BeckhoffADSEntity(Entity):
         if plc_type:
             def setup_notification():
                 return self._hub.add_device_notification(
-                    self._plc_address, plc_type, self._notification_callback
+                    self._plc_address,
+                    plc_type,
+                    self._notification_callback,
+                    self._config.get("deadband", 0.0),
                 )
             
             try:
-                self._notification_handle = await self.hass.async_add_executor_job(
+                self._notification_handle = await self._hub.async_add_io_job(
                     setup_notification
                 )
+                self._hub.invalidate_polled_entities()
                 if self._notification_handle:
                     _LOGGER.debug("Setup notification for %s", self.entity_id)
                 else:
@@ -78,21 +116,11 @@ class BeckhoffADSEntity(Entity):
         """Get PLC type for this entity - to be implemented by subclasses."""
         return None
 
+    @callback
     def _notification_callback(self, address: str, value: Any) -> None:
-        """Handle notification callback - this runs synchronously from ADS thread."""
-        try:
-            # Update the entity state immediately
-            self._process_notification_value(value)
-            self._attr_available = True
-            
-            # Schedule the state update on the HA event loop
-            if self.hass and not self.hass.is_stopping:
-                self.hass.loop.call_soon_threadsafe(
-                    lambda: self.async_write_ha_state()
-                )
-                
-        except Exception as err:
-            _LOGGER.debug("Error processing notification for %s: %s", self.entity_id, err)
+        """Handle notification callback - dispatched by the hub on the event loop."""
+        if self.hass and not self.hass.is_stopping:
+            self._async_handle_value(value)
 
     def _process_notification_value(self, value: Any) -> None:
         """Process notification value - to be implemented by subclasses."""
@@ -102,30 +130,84 @@ class BeckhoffADSEntity(Entity):
         """When entity will be removed from hass."""
         if self._remove_update_listener:
             self._remove_update_listener()
+        
+        if self._notification_handle:
+            try:
+                await self._hub.async_add_io_job(
+                    self._hub.remove_device_notification,
+                    self._notification_handle,
+                    self._notification_callback,
+                )
+            except Exception as err:
+                _LOGGER.debug("Error removing notification for %s: %s", self.entity_id, err)
+            self._notification_handle = None
             
         self._hub.unregister_entity(self)
+        self._hub.invalidate_polled_entities()
 
     async def async_update(self) -> None:
-        """Update the entity - to be implemented by subclasses."""
-        raise NotImplementedError
+        """Update the entity from the PLC."""
+        if not self._hub.connected:
+            self._attr_available = False
+            return
 
-    async def _async_update_wrapper(self, now=None) -> None:
-        """Wrapper for async_update with error handling."""
         try:
-            await self.async_update()
-            self.async_write_ha_state()
+            value = await self._hub.async_read_value(
+                self._plc_address, self._get_plc_type(),
+                max_age_s=self._scan_interval * 0.9,
+            )
+        except PLC_ERRORS as err:
+            # Don't log every error, only when availability changes
+            if self._attr_available:
+                _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
+            self._attr_available = False
+            return
+
+        self._process_notification_value(value)
+        self._attr_available = True
+
+    @callback
+    def _async_handle_value(self, value: Any) -> None:
+        """Handle a value polled by the hub or pushed by a notification."""
+        previous_state = self._state_snapshot()
+        # Unchanged raw values can't change a state nothing else touched
+        if value == self._last_value and previous_state == self._last_state:
+            return
+        
+        try:
+            self._process_notification_value(value)
+            self._attr_available = True
+            self._last_value = value
         except Exception as err:
-            _LOGGER.debug("Update failed for %s: %s", self.entity_id, err)
-            # Don't set unavailable immediately on single failure
-            # Let the entity's async_update method handle availability
+            _LOGGER.debug("Error processing value for %s: %s", self.entity_id, err)
+            self._attr_available = False
+            self._last_value = _UNSET
+        
+        # Most PLC variables change slowly, skip writing an unchanged state
+        self._last_state = self._state_snapshot()
+        if self._last_state != previous_state:
+            self.async_write_ha_state()
+
+    @callback
+    def _async_handle_error(self, err: Exception | None = None) -> None:
+        """Handle a failed poll by the hub."""
+        # Don't log every error, only when availability changes
+        if err is not None and self._attr_available:
+            _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
+        if self._attr_available:
+            self._attr_available = False
+            self.async_write_ha_state()
+
+    def _state_snapshot(self) -> tuple[Any, ...]:
+        """Return the attributes making up the state of the entity."""
+        return (
+            self._attr_available,
+            getattr(self, "_attr_native_value", None),
+            getattr(self, "_attr_is_on", None),
+            getattr(self, "_attr_current_option", None),
+        )
 
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
-        return {
-            "identifiers": {("beckhoff_ads", f"{self._hub.host}_{self._hub.ams_net_id}")},
-            "name": f"Beckhoff PLC ({self._hub.host})",
-            "manufacturer": "Beckhoff",
-            "model": "TwinCAT PLC",
-            "sw_version": "TwinCAT 3",
-        }
\ No newline at end of file
+        return self._hub.device_info
\ No newline at end of file
@@ -4,17 +4,23 @@ from __future__ import annotations
 import asyncio
 import ctypes
 import logging
-import struct
+import random
 import threading
-from collections import namedtuple
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Callable
+from functools import partial
+from typing import Any, Callable, Iterable
 
 import pyads
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
 from .const import (
+    INITIAL_UPDATE_DELAY,
+    LIVENESS_CHECK_INTERVAL,
+    NOTIFICATION_DEBOUNCE,
     RECONNECT_BACKOFF_FACTOR,
     RECONNECT_INITIAL_DELAY,
     RECONNECT_MAX_DELAY,
@@ -22,10 +28,97 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
-# Tuple to hold notification data
-NotificationItem = namedtuple(
-    "NotificationItem", "hnotify huser name plc_datatype callback"
-)
+
+class NotificationItem:
+    """Notification data, looked up on every notification."""
+
+    __slots__ = ("hnotify", "huser", "name", "plc_datatype", "callbacks", "deadband")
+
+    def __init__(
+        self,
+        hnotify: int,
+        huser: int,
+        name: str,
+        plc_datatype: type,
+        callbacks: list[Callable],
+        deadband: float,
+    ) -> None:
+        """Initialize the notification item."""
+        self.hnotify = hnotify
+        self.huser = huser
+        self.name = name
+        self.plc_datatype = plc_datatype
+        self.callbacks = callbacks
+        self.deadband = deadband
+
+
+# Marker for variables without a dispatched notification value
+_UNSET = object()
+
+# Errors raised by PLC reads and writes
+PLC_ERRORS = (pyads.ADSError, ConnectionError, TimeoutError)
+
+# ADS error code of an unknown symbol name
+_ADS_SYMBOL_NOT_FOUND = 0x710
+
+# ADS error codes reporting a timeout: device timeout, client sync timeout
+_ADS_TIMEOUT_CODES = frozenset({0x719, 0x745})
+
+# Index group of the symbol version, changed by a download or online change
+_ADSIGRP_SYM_VERSION = 0xF008
+
+# Offset of the variable data in a notification
+_NOTIFICATION_DATA_OFFSET = pyads.structs.SAdsNotificationHeader.data.offset
+
+# Bound once for the notification callback, which runs for every PLC change
+_addressof = ctypes.addressof
+_string_at = ctypes.string_at
+_monotonic_ns = time.monotonic_ns
+_PLCTYPE_STRING = pyads.PLCTYPE_STRING
+
+# PLC types sum reads decode values with, symbols declared with another
+# type (e.g. SINT, decoded as BYTE) are read one by one
+_SUM_READ_TYPES = frozenset(pyads.constants.ads_type_to_ctype.values())
+
+# Fixed size notification data is read in place from the ADS buffer,
+# TIME/DATE/DT/TOD are read as DINT. ADS data is little endian, like the
+# hosts Home Assistant runs on.
+_CTYPE_READERS: dict[type, type] = {
+    pyads.PLCTYPE_BOOL: ctypes.c_bool,
+    pyads.PLCTYPE_INT: ctypes.c_int16,
+    pyads.PLCTYPE_UINT: ctypes.c_uint16,
+    pyads.PLCTYPE_DINT: ctypes.c_int32,
+    pyads.PLCTYPE_UDINT: ctypes.c_uint32,
+    pyads.PLCTYPE_WORD: ctypes.c_uint16,
+    pyads.PLCTYPE_DWORD: ctypes.c_uint32,
+    pyads.PLCTYPE_BYTE: ctypes.c_uint8,
+    pyads.PLCTYPE_SINT: ctypes.c_int8,
+    pyads.PLCTYPE_USINT: ctypes.c_uint8,
+    pyads.PLCTYPE_REAL: ctypes.c_float,
+    pyads.PLCTYPE_LREAL: ctypes.c_double,
+    pyads.PLCTYPE_TIME: ctypes.c_int32,
+    pyads.PLCTYPE_DATE: ctypes.c_int32,
+    pyads.PLCTYPE_DT: ctypes.c_int32,
+    pyads.PLCTYPE_TOD: ctypes.c_int32,
+}
+
+
+def _sum_read_decodes(plc_type: type | None, symbol_type: type | None) -> bool:
+    """Return if a sum read decodes a symbol like reading it as plc_type."""
+    if plc_type is _PLCTYPE_STRING:
+        # STRING(n) symbols are declared as arrays of characters
+        return getattr(symbol_type, "_type_", symbol_type) is _PLCTYPE_STRING
+    return plc_type is symbol_type and plc_type in _SUM_READ_TYPES
+
+
+def _group_by_type(
+    entities_config: list[dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Group entity configurations by entity type."""
+    configs_by_type: dict[str, list[dict[str, Any]]] = {}
+    for entity_config in entities_config:
+        configs_by_type.setdefault(entity_config.get("type"), []).append(entity_config)
+    return configs_by_type
 
 
 class BeckhoffADSHub:
@@ -38,6 +131,7 @@ class BeckhoffADSHub:
         port: int,
         ams_net_id: str,
         entities_config: list[dict[str, Any]],
+        existing_conn: pyads.Connection | None = None,
     ) -> None:
         """Initialize the hub."""
         self.hass = hass
@@ -45,22 +139,74 @@ class BeckhoffADSHub:
         self.port = port
         self.ams_net_id = ams_net_id
         self.entities_config = entities_config
+        self._configs_by_type = _group_by_type(entities_config)
+        
+        # Shared by all entities of this hub
+        self.unique_id_prefix = f"{host}_{ams_net_id}_"
+        self.device_info = {
+            "identifiers": {("beckhoff_ads", f"{host}_{ams_net_id}")},
+            "name": f"Beckhoff PLC ({host})",
+            "manufacturer": "Beckhoff",
+            "model": "TwinCAT PLC",
+            "sw_version": "TwinCAT 3",
+        }
         
-        self._plc: pyads.Connection | None = None
+        # An already open connection (e.g. from the config flow) is reused
+        self._plc: pyads.Connection | None = existing_conn
+        # Reopened until a disconnect, reconnects start with a fresh instance
+        self._plc_conn: pyads.Connection | None = existing_conn
         self._connected = False
         self._reconnect_task: asyncio.Task | None = None
+        self._check_connection_unsub: CALLBACK_TYPE | None = None
+        # ADS state and symbol version seen by the last liveness check
+        self._plc_state: tuple[int, int] | None = None
+        self._last_liveness_check = time.monotonic()
         self._reconnect_delay = RECONNECT_INITIAL_DELAY
         self._entities: list[Any] = []
         
-        # Use threading lock like the original integration
+        # PLC I/O runs on a single dedicated worker, the ADS connection
+        # handles one request at a time anyway. The lock only guards the
+        # notification items shared with the ADS callback thread.
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="beckhoff_ads_io"
+        )
         self._lock = threading.Lock()
         self._connection_failures = 0
         self._max_failures_before_reconnect = 3
         
         # Notification system
         self._notification_items = {}
+        # Handle per (address, PLC type), shared by entities of one variable
+        self._notification_handles: dict[tuple[str, type], int] = {}
         self._notification_enabled = True
         
+        # Latest notified value per handle, dispatched on the event loop
+        self._pending_notifications: dict[int, Any] = {}
+        self._last_notified: dict[int, Any] = {}
+        self._notification_flush_scheduled = False
+        
+        # Last read value and its timestamp per (address, PLC type)
+        # Timestamps are time.monotonic_ns() values
+        self._read_cache: dict[tuple[str, int], tuple[int, Any]] = {}
+        
+        # Variables that made a sum read fail as a whole, read one by one
+        self._sum_read_excluded: set[str] = set()
+        # Type each symbol is declared with in the PLC program, None when it
+        # has no plain PLC type or could not be looked up
+        self._symbol_types: dict[str, type | None] = {}
+        
+        # Entity class and add callback of each set up platform, keyed by
+        # entity type, used to add entities on YAML reload
+        self._platforms: dict[str, tuple[type, AddEntitiesCallback]] = {}
+        
+        # Polling groups, keyed by scan interval, read with one ADS request each
+        self._poll_groups: dict[int, list[Any]] = {}
+        self._polled_entities: dict[int, list[Any]] = {}
+        self._polled_entities_stale = True
+        self._poll_listeners: dict[int, CALLBACK_TYPE] = {}
+        self._new_entities: list[Any] = []
+        self._new_entities_unsub: CALLBACK_TYPE | None = None
+        
         # Timeout and recovery settings
         self._operation_timeout = 5.0  # seconds for read/write operations
         self._consecutive_timeouts = 0
@@ -71,35 +217,113 @@ class BeckhoffADSHub:
         await self._async_connect()
         
         # Start reconnection monitoring
-        async_track_time_interval(
+        self._check_connection_unsub = async_track_time_interval(
             self.hass, self._async_check_connection, timedelta(seconds=5)
         )
 
+    @callback
+    def async_register_platform(
+        self,
+        entity_type: str,
+        entity_class: type,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Register a set up platform, adding its entities on YAML reload."""
+        self._platforms[entity_type] = (entity_class, async_add_entities)
+
     async def async_update_entities_config(self, entities_config: list[dict[str, Any]]) -> None:
-        """Update entities configuration after YAML reload."""
+        """Update entities configuration after YAML reload.
+        
+        Only the delta is applied: entities with an unchanged configuration
+        keep running, removed ones are removed, changed ones are replaced and
+        new ones are added. Notifications are shared per variable, so only
+        variables no entity uses anymore are deleted and only new variables
+        are registered with the PLC.
+        """
         _LOGGER.info("Updating entities configuration with %d entities", len(entities_config))
         self.entities_config = entities_config
+        self._configs_by_type = _group_by_type(entities_config)
+        self._sum_read_excluded.clear()
+        
+        # Match running entities with the new configurations by address
+        added: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for entity_config in entities_config:
+            added.setdefault(
+                (entity_config["type"], entity_config["plc_address"]), []
+            ).append(entity_config)
         
-        # Notify existing entities about config update
+        kept = []
+        removed = []
         for entity in self._entities:
-            if hasattr(entity, 'async_update_config'):
-                await entity.async_update_config()
-            # Force update all entities
-            if hasattr(entity, 'async_update'):
-                try:
-                    await entity.async_update()
-                    entity.async_write_ha_state()
-                except Exception as err:
-                    _LOGGER.debug("Failed to update entity after config reload: %s", err)
+            configs = added.get((entity._config.get("type"), entity._plc_address))
+            if configs and entity._config in configs:
+                configs.remove(entity._config)
+                kept.append(entity)
+            else:
+                removed.append(entity)
+        
+        _LOGGER.debug(
+            "Keeping %d entities, removing %d, adding %d",
+            len(kept),
+            len(removed),
+            sum(len(configs) for configs in added.values()),
+        )
+        
+        # Removed before adding, changed entities are added again with the
+        # same unique ID
+        await asyncio.gather(*(
+            entity.async_remove() for entity in removed if entity.hass is not None
+        ))
+        for entity in removed:
+            self.unregister_entity(entity)
+        
+        for (entity_type, _), configs in added.items():
+            if not configs:
+                continue
+            if entity_type not in self._platforms:
+                _LOGGER.warning("Platform %s is not set up, skipping %d entities",
+                               entity_type, len(configs))
+                continue
+            entity_class, async_add_entities = self._platforms[entity_type]
+            async_add_entities(
+                [entity_class(self, entity_config) for entity_config in configs]
+            )
+        
+        # Retry notifications that failed before, and refresh all kept
+        # entities with a single request. New entities do both when added.
+        await asyncio.gather(*(
+            entity._async_setup_notification() for entity in kept
+            if entity._use_notifications
+            and entity._notification_handle not in self._notification_items
+        ))
+        await self._async_read_entities(kept, 0)
 
     async def async_close(self) -> None:
         """Close the hub."""
+        if self._check_connection_unsub:
+            self._check_connection_unsub()
+            self._check_connection_unsub = None
         if self._reconnect_task:
             self._reconnect_task.cancel()
         
+        for remove_listener in self._poll_listeners.values():
+            remove_listener()
+        self._poll_listeners.clear()
+        if self._new_entities_unsub:
+            self._new_entities_unsub()
+            self._new_entities_unsub = None
+        self._new_entities.clear()
+        self._poll_groups.clear()
+        self._polled_entities.clear()
+        
         # Clean up notifications
         await self._async_cleanup_notifications()
         await self._async_disconnect()
+        self._io_executor.shutdown(wait=False)
+
+    def async_add_io_job(self, target: Callable[..., Any], *args: Any) -> asyncio.Future:
+        """Run a blocking PLC call on the hub's I/O worker."""
+        return self.hass.loop.run_in_executor(self._io_executor, target, *args)
 
     async def _async_cleanup_notifications(self) -> None:
         """Clean up all ADS notifications."""
@@ -121,25 +345,35 @@ class BeckhoffADSHub:
                     except Exception as err:
                         _LOGGER.debug("Error deleting notification: %s", err)
                 self._notification_items.clear()
+                self._notification_handles.clear()
+                self._last_notified.clear()
         
-        await self.hass.async_add_executor_job(cleanup_notifications)
+        await self.async_add_io_job(cleanup_notifications)
+        self.invalidate_polled_entities()
 
     async def _async_connect(self) -> None:
         """Connect to PLC."""
         try:
-            # Clean up any existing connection first
-            if self._plc:
-                try:
-                    await self.hass.async_add_executor_job(self._plc.close)
-                except Exception:
-                    pass
-                self._plc = None
-            
-            self._plc = pyads.Connection(self.ams_net_id, self.port, self.host)
-            await self.hass.async_add_executor_job(self._plc.open)
+            if self._plc and self._plc.is_open and not self._connected:
+                _LOGGER.debug("Reusing open connection to %s", self.host)
+            else:
+                # Clean up any existing connection first
+                if self._plc:
+                    try:
+                        await self.async_add_io_job(self._plc.close)
+                    except Exception:
+                        pass
+                    self._plc = None
+                
+                if self._plc_conn is None:
+                    self._plc_conn = pyads.Connection(
+                        self.ams_net_id, self.port, self.host
+                    )
+                self._plc = self._plc_conn
+                await self.async_add_io_job(self._plc.open)
             
             # Test the connection
-            await self.hass.async_add_executor_job(self._plc.read_state)
+            await self.async_add_io_job(self._plc.read_state)
             
             self._connected = True
             self._reconnect_delay = RECONNECT_INITIAL_DELAY
@@ -154,18 +388,37 @@ class BeckhoffADSHub:
             self._connected = False
             if self._plc:
                 try:
-                    await self.hass.async_add_executor_job(self._plc.close)
+                    await self.async_add_io_job(self._plc.close)
                 except Exception:
                     pass
                 self._plc = None
             raise
 
-    def add_device_notification(self, address: str, plc_type: type, callback: Callable):
-        """Add a notification for real-time updates - synchronous like original."""
+    def add_device_notification(
+        self, address: str, plc_type: type, callback: Callable, deadband: float = 0.0
+    ):
+        """Add a notification for real-time updates - synchronous like original.
+        
+        Numeric values changing by less than deadband from the last
+        dispatched value are not passed to the callback. Callbacks for the
+        same variable and PLC type share one ADS notification, using the
+        smallest deadband requested.
+        """
         if not self._connected or not self._plc or not self._notification_enabled:
             return None
             
         with self._lock:
+            hnotify = self._notification_handles.get((address, plc_type))
+            notification_item = self._notification_items.get(hnotify)
+            if notification_item is not None:
+                if callback not in notification_item.callbacks:
+                    notification_item.callbacks.append(callback)
+                notification_item.deadband = min(notification_item.deadband, deadband)
+                _LOGGER.debug(
+                    "Sharing device notification %d for variable %s", hnotify, address
+                )
+                return hnotify
+            
             try:
                 attr = pyads.NotificationAttrib(ctypes.sizeof(plc_type))
                 hnotify, huser = self._plc.add_device_notification(
@@ -174,8 +427,9 @@ class BeckhoffADSHub:
                 
                 hnotify = int(hnotify)
                 self._notification_items[hnotify] = NotificationItem(
-                    hnotify, huser, address, plc_type, callback
+                    hnotify, huser, address, plc_type, [callback], deadband
                 )
+                self._notification_handles[(address, plc_type)] = hnotify
                 
                 _LOGGER.debug(
                     "Added device notification %d for variable %s", hnotify, address
@@ -187,6 +441,45 @@ class BeckhoffADSHub:
                 _LOGGER.warning("Error subscribing to %s: %s", address, err)
                 return None
 
+    def remove_device_notification(self, hnotify: int, callback: Callable) -> None:
+        """Remove a notification callback - synchronous like adding it.
+        
+        The ADS notification is deleted together with its last callback.
+        """
+        with self._lock:
+            notification_item = self._notification_items.get(hnotify)
+            if notification_item is None:
+                return
+            
+            # Replace rather than mutate the list, it may be iterated by a
+            # flush on the event loop
+            notification_item.callbacks = [
+                notification_callback
+                for notification_callback in notification_item.callbacks
+                if notification_callback != callback
+            ]
+            if notification_item.callbacks:
+                return
+            
+            del self._notification_items[hnotify]
+            self._notification_handles.pop(
+                (notification_item.name, notification_item.plc_datatype), None
+            )
+            self._last_notified.pop(hnotify, None)
+            
+            _LOGGER.debug(
+                "Deleting device notification %d, %d",
+                notification_item.hnotify,
+                notification_item.huser,
+            )
+            if self._plc:
+                try:
+                    self._plc.del_device_notification(
+                        notification_item.hnotify, notification_item.huser
+                    )
+                except Exception as err:
+                    _LOGGER.debug("Error deleting notification: %s", err)
+
     def _device_notification_callback(self, notification, name):
         """Handle device notifications."""
         try:
@@ -194,17 +487,11 @@ class BeckhoffADSHub:
             hnotify = int(contents.hNotification)
             _LOGGER.debug("Received notification %d for variable change", hnotify)
 
-            # Get dynamically sized data array
-            data_size = contents.cbSampleSize
-            data_address = (
-                ctypes.addressof(contents)
-                + pyads.structs.SAdsNotificationHeader.data.offset
-            )
-            data = (ctypes.c_ubyte * data_size).from_address(data_address)
+            data_address = _addressof(contents) + _NOTIFICATION_DATA_OFFSET
 
-            # Get notification item
-            with self._lock:
-                notification_item = self._notification_items.get(hnotify)
+            # Get notification item, a single dict lookup is atomic and
+            # doesn't need the lock held by add/cleanup
+            notification_item = self._notification_items.get(hnotify)
 
             if not notification_item:
                 _LOGGER.debug("Unknown device notification handle: %d", hnotify)
@@ -213,45 +500,75 @@ class BeckhoffADSHub:
             # Parse data based on PLC data type
             plc_datatype = notification_item.plc_datatype
             
-            if plc_datatype == pyads.PLCTYPE_BOOL:
-                value = bool(struct.unpack("<?", bytearray(data))[0])
-            elif plc_datatype == pyads.PLCTYPE_INT:
-                value = struct.unpack("<h", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_UINT:
-                value = struct.unpack("<H", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_DINT:
-                value = struct.unpack("<i", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_UDINT:
-                value = struct.unpack("<I", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_WORD:
-                value = struct.unpack("<H", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_DWORD:
-                value = struct.unpack("<I", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_BYTE:
-                value = struct.unpack("<B", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_SINT:
-                value = struct.unpack("<b", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_USINT:
-                value = struct.unpack("<B", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_REAL:
-                value = struct.unpack("<f", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_LREAL:
-                value = struct.unpack("<d", bytearray(data))[0]
-            elif plc_datatype == pyads.PLCTYPE_STRING:
-                value = bytearray(data).split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
-            elif plc_datatype in [pyads.PLCTYPE_TIME, pyads.PLCTYPE_DATE, pyads.PLCTYPE_DT, pyads.PLCTYPE_TOD]:
-                value = struct.unpack("<i", bytearray(data))[0]  # Treat as DINT
+            reader = _CTYPE_READERS.get(plc_datatype)
+            if reader is not None:
+                value = reader.from_address(data_address).value
+            elif plc_datatype == _PLCTYPE_STRING:
+                # Copy the dynamically sized data and cut at the terminator
+                raw = _string_at(data_address, contents.cbSampleSize)
+                end = raw.find(b"\x00")
+                if end >= 0:
+                    raw = raw[:end]
+                value = raw.decode("utf-8", errors="ignore")
             else:
-                value = bytearray(data)
                 _LOGGER.debug("Unsupported datatype for notification")
                 return
 
-            # Call the callback with parsed value
-            notification_item.callback(notification_item.name, value)
+            # Keep the read cache current, so cached reads see pushed values
+            self._read_cache[(notification_item.name, id(plc_datatype))] = (
+                _monotonic_ns(), value
+            )
+            
+            # Skip values that did not change (beyond the deadband) since the
+            # last dispatched one
+            previous = self._last_notified.get(hnotify, _UNSET)
+            if previous == value or (
+                isinstance(value, float)
+                and isinstance(previous, float)
+                and abs(previous - value) < notification_item.deadband
+            ):
+                return
+            self._last_notified[hnotify] = value
+            
+            # Coalesce notifications per handle and dispatch them from the
+            # event loop once per debounce window
+            self._pending_notifications[hnotify] = value
+            if not self._notification_flush_scheduled:
+                self._notification_flush_scheduled = True
+                self.hass.loop.call_soon_threadsafe(
+                    self._async_schedule_notification_flush
+                )
             
         except Exception as err:
             _LOGGER.debug("Error in notification callback: %s", err)
 
+    @callback
+    def _async_schedule_notification_flush(self) -> None:
+        """Dispatch pending notifications after the debounce window."""
+        self.hass.loop.call_later(
+            NOTIFICATION_DEBOUNCE, self._async_flush_notifications
+        )
+
+    @callback
+    def _async_flush_notifications(self) -> None:
+        """Dispatch the latest value of each notified variable."""
+        # Clear the flag before draining, a notification arriving meanwhile
+        # is either drained below or schedules another flush
+        self._notification_flush_scheduled = False
+        
+        while self._pending_notifications:
+            hnotify, value = self._pending_notifications.popitem()
+            notification_item = self._notification_items.get(hnotify)
+            if not notification_item:
+                continue
+            for notification_callback in notification_item.callbacks:
+                try:
+                    notification_callback(notification_item.name, value)
+                except Exception as err:
+                    _LOGGER.debug(
+                        "Error dispatching notification %d: %s", hnotify, err
+                    )
+
     async def _async_disconnect(self) -> None:
         """Disconnect from PLC."""
         if self._plc:
@@ -259,15 +576,32 @@ class BeckhoffADSHub:
             await self._async_cleanup_notifications()
             
             try:
-                await self.hass.async_add_executor_job(self._plc.close)
+                await self.async_add_io_job(self._plc.close)
             except Exception as err:
                 _LOGGER.debug("Error closing PLC connection: %s", err)
             finally:
                 self._plc = None
+                # The PLC program may change while disconnected, reconnect
+                # with a fresh connection without symbol info cached by pyads
+                self._plc_conn = None
                 self._connected = False
+                self._read_cache.clear()
+                self._sum_read_excluded.clear()
+                self._symbol_types.clear()
+                self._plc_state = None
 
     async def _async_check_connection(self, now=None) -> None:
         """Check PLC connection and reconnect if needed."""
+        # Healthy connections are only probed now and then
+        if (
+            self._connected
+            and self._connection_failures < self._max_failures_before_reconnect
+            and self._consecutive_timeouts < self._max_consecutive_timeouts
+        ):
+            if time.monotonic() - self._last_liveness_check >= LIVENESS_CHECK_INTERVAL:
+                await self._async_check_liveness()
+            return
+        
         if not self._connected or not self._plc:
             if not self._reconnect_task or self._reconnect_task.done():
                 self._reconnect_task = self.hass.async_create_task(
@@ -275,19 +609,10 @@ class BeckhoffADSHub:
                 )
             return
 
-        # Only check connection if we've had recent failures or timeouts
-        if (self._connection_failures < self._max_failures_before_reconnect and 
-            self._consecutive_timeouts < self._max_consecutive_timeouts):
-            return
-
         # Test connection with a simple read
         try:
-            def test_connection():
-                with self._lock:
-                    return self._plc.read_state()
-            
             await asyncio.wait_for(
-                self.hass.async_add_executor_job(test_connection),
+                self.async_add_io_job(self._plc.read_state),
                 timeout=self._operation_timeout
             )
             
@@ -295,6 +620,8 @@ class BeckhoffADSHub:
             self._connection_failures = 0
             self._consecutive_timeouts = 0
             self._reconnect_delay = RECONNECT_INITIAL_DELAY
+            # Give excluded variables another chance in sum reads
+            self._sum_read_excluded.clear()
             
         except (asyncio.TimeoutError, Exception) as err:
             _LOGGER.warning("Connection test failed: %s", err)
@@ -307,6 +634,54 @@ class BeckhoffADSHub:
                     self._async_reconnect()
                 )
 
+    async def _async_check_liveness(self) -> None:
+        """Check a healthy connection still delivers current values.
+        
+        A PLC restart or program download drops notifications without
+        disconnecting, and notification backed entities would never be read
+        again. Reconnect with a fresh connection when the ADS state or symbol
+        version changed, re-establishing notifications and dropping symbol
+        info cached for the old program. Otherwise refresh those entities
+        with one sum read, which also corrects writes the PLC rejected or
+        reverted.
+        """
+        self._last_liveness_check = time.monotonic()
+        
+        def read_plc_state():
+            ads_state, _ = self._plc.read_state()
+            symbol_version = self._plc.read(
+                _ADSIGRP_SYM_VERSION, 0, pyads.PLCTYPE_BYTE
+            )
+            return ads_state, symbol_version
+        
+        try:
+            plc_state = await asyncio.wait_for(
+                self.async_add_io_job(read_plc_state),
+                timeout=self._operation_timeout
+            )
+        except PLC_ERRORS as err:
+            # Counted like failed reads, the connection test takes over from here
+            await self._async_record_failure(err, "checking PLC state")
+            return
+        
+        previous_state, self._plc_state = self._plc_state, plc_state
+        if previous_state is not None and previous_state != plc_state:
+            _LOGGER.info("PLC state or program changed, reconnecting")
+            self._connected = False
+            await self._async_disconnect()
+            if not self._reconnect_task or self._reconnect_task.done():
+                self._reconnect_task = self.hass.async_create_task(
+                    self._async_reconnect()
+                )
+            return
+        
+        entities = [
+            entity for entity in self._polling_entities()
+            if entity._notification_handle in self._notification_items
+        ]
+        if entities:
+            await self._async_read_entities(entities, 0)
+
     async def _async_reconnect(self) -> None:
         """Reconnect to PLC with exponential backoff."""
         while not self._connected:
@@ -319,7 +694,10 @@ class BeckhoffADSHub:
                         
             except Exception as err:
                 _LOGGER.debug("Reconnection failed: %s", err)
-                await asyncio.sleep(self._reconnect_delay)
+                # Jitter the delay so hubs don't retry in lockstep
+                await asyncio.sleep(
+                    random.uniform(RECONNECT_INITIAL_DELAY, self._reconnect_delay)
+                )
                 self._reconnect_delay = min(
                     self._reconnect_delay * RECONNECT_BACKOFF_FACTOR,
                     RECONNECT_MAX_DELAY
@@ -329,23 +707,19 @@ class BeckhoffADSHub:
         """Notify all entities that connection has been restored."""
         _LOGGER.info("Connection restored, updating %d entities", len(self._entities))
         
-        # Re-establish notifications for all entities
-        for entity in self._entities:
-            if hasattr(entity, '_use_notifications') and entity._use_notifications:
-                try:
-                    await entity._async_setup_notification()
-                except Exception as err:
-                    _LOGGER.debug("Failed to re-setup notification for %s: %s", 
-                                getattr(entity, 'entity_id', 'unknown'), err)
+        # Re-establish notifications for all entities, queued together
+        # on the I/O worker; each entity logs its own setup failure
+        await asyncio.gather(*(
+            entity._async_setup_notification() for entity in self._entities
+            if getattr(entity, '_use_notifications', False)
+        ))
         
-        # Update all entities
-        for entity in self._entities:
-            try:
-                await entity.async_update()
-                entity.async_write_ha_state()
-            except Exception as err:
-                _LOGGER.debug("Failed to update entity %s after reconnection: %s", 
-                            getattr(entity, 'entity_id', 'unknown'), err)
+        # Update all entities with a single request
+        await self._async_read_entities(self._polling_entities(), 0)
+
+    def configs_for(self, entity_type: str) -> list[dict[str, Any]]:
+        """Return the entity configurations of an entity type."""
+        return self._configs_by_type.get(entity_type, [])
 
     def register_entity(self, entity) -> None:
         """Register an entity with the hub."""
@@ -356,6 +730,129 @@ class BeckhoffADSHub:
         if entity in self._entities:
             self._entities.remove(entity)
 
+    @callback
+    def async_track_poll(self, entity) -> CALLBACK_TYPE:
+        """Poll an entity together with all entities sharing its scan interval."""
+        scan_interval = entity._scan_interval
+        group = self._poll_groups.setdefault(scan_interval, [])
+        group.append(entity)
+        self.invalidate_polled_entities()
+        
+        # Entities added together are read together for their initial value
+        self._new_entities.append(entity)
+        if self._new_entities_unsub is None:
+            self._new_entities_unsub = async_call_later(
+                self.hass, INITIAL_UPDATE_DELAY, self._async_update_new_entities
+            )
+        
+        if scan_interval not in self._poll_listeners:
+            self._poll_listeners[scan_interval] = async_track_time_interval(
+                self.hass,
+                partial(self._async_poll_group, scan_interval),
+                timedelta(seconds=scan_interval),
+            )
+        
+        @callback
+        def remove_poll() -> None:
+            """Stop polling the entity."""
+            if entity in group:
+                group.remove(entity)
+                self.invalidate_polled_entities()
+            if entity in self._new_entities:
+                self._new_entities.remove(entity)
+            
+            # Stop the timer of a group without entities
+            if not group and self._poll_groups.get(scan_interval) is group:
+                del self._poll_groups[scan_interval]
+                if remove_listener := self._poll_listeners.pop(scan_interval, None):
+                    remove_listener()
+        
+        return remove_poll
+
+    @callback
+    def invalidate_polled_entities(self) -> None:
+        """Rebuild the polled entities before the next poll.
+        
+        Must be called whenever entities are added or removed, or a
+        notification handle of an entity changes.
+        """
+        self._polled_entities_stale = True
+
+    def _update_polled_entities(self) -> None:
+        """Collect the entities of each polling group that need polling."""
+        # Entities with a live notification are kept up to date by the PLC,
+        # only poll the ones where notifications are disabled or failed
+        self._polled_entities = {
+            scan_interval: [
+                entity
+                for entity in group
+                if entity._notification_handle not in self._notification_items
+            ]
+            for scan_interval, group in self._poll_groups.items()
+        }
+        self._polled_entities_stale = False
+
+    async def _async_poll_group(self, scan_interval: int, now=None) -> None:
+        """Read all addresses of a polling group in a single ADS request."""
+        if self._polled_entities_stale:
+            self._update_polled_entities()
+        
+        entities = list(self._polled_entities.get(scan_interval, ()))
+        if entities:
+            # 90% of the scan interval, serving addresses recently read by
+            # another group from cache. Cached values are stamped when their
+            # read was requested, so the group's own previous read is always
+            # older than that on its next tick
+            await self._async_read_entities(entities, scan_interval * 900_000_000)
+
+    async def _async_update_new_entities(self, now=None) -> None:
+        """Read the initial value of all recently added entities at once."""
+        self._new_entities_unsub = None
+        entities, self._new_entities = self._new_entities, []
+        if entities:
+            await self._async_read_entities(entities, 0)
+
+    def _polling_entities(self) -> list[Any]:
+        """Return all entities added to Home Assistant and polled by the hub."""
+        return [entity for group in self._poll_groups.values() for entity in group]
+
+    async def _async_read_entities(self, entities: list[Any], max_age_ns: int) -> None:
+        """Read the values of entities in a single ADS request and apply them."""
+        if not self._connected or not self._plc:
+            for entity in entities:
+                entity._async_handle_error()
+            return
+        
+        # Entities of one variable read with different PLC types get the
+        # value decoded with their own type
+        keys = [(entity._plc_address, entity._get_plc_type()) for entity in entities]
+        now_ns = time.monotonic_ns()
+        values = {}
+        variables = set()
+        for key in keys:
+            if key in values or key in variables:
+                continue
+            cached = self._read_cache.get((key[0], id(key[1])))
+            if cached is not None and now_ns - cached[0] < max_age_ns:
+                values[key] = cached[1]
+            else:
+                variables.add(key)
+        
+        if variables:
+            try:
+                values.update(await self.async_read_list(variables))
+            except Exception as err:
+                for entity in entities:
+                    entity._async_handle_error(err)
+                return
+        
+        for entity, key in zip(entities, keys):
+            value = values.get(key)
+            if isinstance(value, Exception):
+                entity._async_handle_error(value)
+            else:
+                entity._async_handle_value(value)
+
     @property
     def connected(self) -> bool:
         """Return if PLC is connected."""
@@ -381,153 +878,258 @@ class BeckhoffADSHub:
                 self._async_reconnect()
             )
 
-    async def async_read_value(self, address: str, plc_type: type = None):
-        """Read value from PLC using threading lock with timeout handling."""
+    async def async_read_value(
+        self, address: str, plc_type: type = None, max_age_s: float = 0.0
+    ):
+        """Read value from PLC on the I/O worker with timeout handling.
+        
+        Values read less than max_age_s seconds ago are served from cache.
+        """
         if not self._connected or not self._plc:
-            raise Exception("PLC not connected")
+            raise ConnectionError("PLC not connected")
+        
+        cache_key = (address, id(plc_type))
+        if max_age_s:
+            cached = self._read_cache.get(cache_key)
+            if (
+                cached is not None
+                and time.monotonic_ns() - cached[0] < int(max_age_s * 1_000_000_000)
+            ):
+                return cached[1]
         
         def read_value():
-            """Synchronous read with lock and timeout handling."""
-            with self._lock:
-                try:
-                    if plc_type:
-                        return self._plc.read_by_name(address, plc_type)
-                    else:
-                        return self._plc.read_by_name(address)
-                except pyads.ADSError as err:
-                    if "timeout" in str(err).lower():
-                        raise TimeoutError(f"ADS timeout reading {address}: {err}")
-                    else:
-                        raise Exception(f"ADS Error: {err}")
-                except Exception as err:
-                    if "timeout" in str(err).lower():
-                        raise TimeoutError(f"Timeout reading {address}: {err}")
-                    raise
+            """Synchronous read with timeout handling."""
+            try:
+                if plc_type:
+                    return self._plc.read_by_name(address, plc_type)
+                else:
+                    return self._plc.read_by_name(address)
+            except pyads.ADSError as err:
+                if err.err_code in _ADS_TIMEOUT_CODES:
+                    raise TimeoutError(f"ADS timeout reading {address}: {err}")
+                raise
+            except TimeoutError as err:
+                raise TimeoutError(f"Timeout reading {address}: {err}") from err
         
+        # Stamp cached values with the time the read was requested, a value
+        # must not look fresher by the time it spent queued or in flight
+        requested_ns = time.monotonic_ns()
         try:
             # Use asyncio.wait_for to add an overall timeout
             value = await asyncio.wait_for(
-                self.hass.async_add_executor_job(read_value),
+                self.async_add_io_job(read_value),
                 timeout=self._operation_timeout
             )
             
             # Reset counters on successful read
             self._connection_failures = 0
             self._consecutive_timeouts = 0
+            self._read_cache[cache_key] = (requested_ns, value)
             return value
             
-        except asyncio.TimeoutError:
-            self._consecutive_timeouts += 1
-            self._connection_failures += 1
-            _LOGGER.warning("Read timeout for %s (timeout %d/%d, failure %d/%d)", 
-                          address, self._consecutive_timeouts, self._max_consecutive_timeouts,
-                          self._connection_failures, self._max_failures_before_reconnect)
-            
-            # Force reconnection after too many consecutive timeouts
-            if self._consecutive_timeouts >= self._max_consecutive_timeouts:
-                _LOGGER.error("Too many consecutive timeouts, forcing reconnection")
-                self._connected = False
-                await self._async_disconnect()
-            
-            raise Exception(f"Timeout reading {address}")
-            
-        except TimeoutError as err:
-            self._consecutive_timeouts += 1
-            self._connection_failures += 1
-            _LOGGER.warning("ADS timeout for %s: %s (timeout %d/%d)", 
-                          address, err, self._consecutive_timeouts, self._max_consecutive_timeouts)
-            
-            if self._consecutive_timeouts >= self._max_consecutive_timeouts:
-                _LOGGER.error("Too many consecutive timeouts, forcing reconnection")
-                self._connected = False
-                await self._async_disconnect()
-            
+        except Exception as err:
+            await self._async_record_failure(err, f"reading {address}")
+            if isinstance(err, TimeoutError) and not str(err):
+                # asyncio.wait_for timed out
+                raise TimeoutError(f"Timeout reading {address}") from err
             raise
-            
+
+    async def _async_clear_symbol_info(self) -> None:
+        """Drop the symbol info cached for sum reads after a failed one.
+        
+        Symbol offsets go stale after an online change, sum reads then fail
+        or read the wrong memory. Program changes found by the liveness check
+        rebuild the connection, here the pyads cache is cleared in place when
+        this pyads version has it.
+        """
+        self._symbol_types.clear()
+        cache = getattr(self._plc, "_symbol_info_cache", None)
+        if not isinstance(cache, dict):
+            return
+        try:
+            # On the I/O worker, so it never races a sum read using the cache
+            await self.async_add_io_job(cache.clear)
         except Exception as err:
-            # Increment failure count but don't immediately disconnect
-            self._connection_failures += 1
-            _LOGGER.debug("Failed to read %s (failure %d/%d): %s", 
-                         address, self._connection_failures, 
-                         self._max_failures_before_reconnect, err)
+            _LOGGER.debug("Error clearing symbol info cache: %s", err)
+
+    def _invalidate_read_cache(self, address: str) -> None:
+        """Drop cached values of an address for all PLC types."""
+        for key in list(self._read_cache):
+            if key[0] == address:
+                self._read_cache.pop(key, None)
+
+    async def async_read_list(
+        self, variables: set[tuple[str, type]]
+    ) -> dict[tuple[str, type], Any]:
+        """Read several variables with a single ADS sum request.
+        
+        Variables are (address, PLC type) pairs. Sum reads decode values with the type a symbol is declared with in
+        the PLC program, variables configured with another type are read one
+        by one like single reads. Variables that could not be read are mapped
+        to the exception describing the failure instead of a value.
+        """
+        if not self._connected or not self._plc:
+            raise ConnectionError("PLC not connected")
+        
+        plc = self._plc
+        symbol_types = self._symbol_types
+        excluded = self._sum_read_excluded
+        
+        def read_list():
+            """Synchronous sum read with timeout handling."""
+            try:
+                # Look up the declared type of symbols read for the first time
+                for address in {address for address, _ in variables}:
+                    if address in symbol_types or address in excluded:
+                        continue
+                    try:
+                        symbol_types[address] = plc.get_symbol(address).plc_type
+                    except pyads.ADSError as err:
+                        if err.err_code in _ADS_TIMEOUT_CODES:
+                            raise
+                        # Reported by the single read of the variable
+                        symbol_types[address] = None
+                
+                sum_read = {
+                    address: plc_type
+                    for address, plc_type in variables
+                    if address not in excluded
+                    and _sum_read_decodes(plc_type, symbol_types.get(address))
+                }
+                if not sum_read:
+                    return sum_read, {}
+                return sum_read, plc.read_list_by_name(list(sum_read))
+            except pyads.ADSError as err:
+                # Timeouts must not fall back to reading variables one by one
+                if err.err_code in _ADS_TIMEOUT_CODES:
+                    raise TimeoutError(
+                        f"ADS timeout reading {len(variables)} variables: {err}"
+                    ) from err
+                raise
+        
+        requested_ns = time.monotonic_ns()
+        try:
+            # Use asyncio.wait_for to add an overall timeout
+            sum_read, result = await asyncio.wait_for(
+                self.async_add_io_job(read_list),
+                timeout=self._operation_timeout
+            )
             
-            # Only trigger reconnection after multiple failures
-            if self._connection_failures >= self._max_failures_before_reconnect:
-                _LOGGER.warning("Multiple read failures, will test connection")
+        except TimeoutError as err:
+            await self._async_record_failure(err, f"reading {len(variables)} variables")
+            await self._async_clear_symbol_info()
+            raise TimeoutError(f"Timeout reading {len(variables)} variables") from err
             
-            raise
+        except Exception as err:
+            # The sum request fails as a whole when a single symbol cannot be
+            # resolved, fall back to reading the variables one by one
+            _LOGGER.debug("Sum read failed, reading %d variables individually: %s",
+                         len(variables), err)
+            await self._async_clear_symbol_info()
+            return await self._async_read_each(variables)
+        
+        values = {}
+        if sum_read:
+            # Reset counters on successful read
+            self._connection_failures = 0
+            self._consecutive_timeouts = 0
+        
+        # Per-variable errors are reported by pyads as error description strings
+        for address, plc_type in sum_read.items():
+            value = result.get(address)
+            if isinstance(value, str) and plc_type is not pyads.PLCTYPE_STRING:
+                _LOGGER.debug("Failed to read %s: %s", address, value)
+                values[(address, plc_type)] = Exception(f"ADS Error: {value}")
+            else:
+                values[(address, plc_type)] = value
+                self._read_cache[(address, id(plc_type))] = (requested_ns, value)
+        
+        values.update(await self._async_read_each(
+            variable for variable in variables if variable not in values
+        ))
+        return values
+
+    async def _async_read_each(
+        self, variables: Iterable[tuple[str, type]]
+    ) -> dict[tuple[str, type], Any]:
+        """Read variables one by one, mapping failures to their exception."""
+        values = {}
+        for address, plc_type in variables:
+            try:
+                values[(address, plc_type)] = await self.async_read_value(
+                    address, plc_type
+                )
+            except Exception as read_err:
+                values[(address, plc_type)] = read_err
+                # Keep symbols missing from the PLC program out of later
+                # sum reads, so they don't fail the whole request every time
+                if (
+                    isinstance(read_err, pyads.ADSError)
+                    and read_err.err_code == _ADS_SYMBOL_NOT_FOUND
+                ):
+                    self._sum_read_excluded.add(address)
+        return values
 
     async def async_write_value(self, address: str, value: Any, plc_type: type = None):
-        """Write value to PLC using threading lock with timeout handling."""
+        """Write value to PLC on the I/O worker with timeout handling."""
         if not self._connected or not self._plc:
-            raise Exception("PLC not connected")
+            raise ConnectionError("PLC not connected")
         
         def write_value():
-            """Synchronous write with lock and timeout handling."""
-            with self._lock:
-                try:
-                    if plc_type:
-                        return self._plc.write_by_name(address, value, plc_type)
-                    else:
-                        return self._plc.write_by_name(address, value)
-                except pyads.ADSError as err:
-                    if "timeout" in str(err).lower():
-                        raise TimeoutError(f"ADS timeout writing to {address}: {err}")
-                    else:
-                        raise Exception(f"ADS Error: {err}")
-                except Exception as err:
-                    if "timeout" in str(err).lower():
-                        raise TimeoutError(f"Timeout writing to {address}: {err}")
-                    raise
+            """Synchronous write with timeout handling."""
+            try:
+                if plc_type:
+                    return self._plc.write_by_name(address, value, plc_type)
+                else:
+                    return self._plc.write_by_name(address, value)
+            except pyads.ADSError as err:
+                if err.err_code in _ADS_TIMEOUT_CODES:
+                    raise TimeoutError(f"ADS timeout writing to {address}: {err}")
+                raise
+            except TimeoutError as err:
+                raise TimeoutError(f"Timeout writing to {address}: {err}") from err
         
         try:
             # Use asyncio.wait_for to add an overall timeout
             await asyncio.wait_for(
-                self.hass.async_add_executor_job(write_value),
+                self.async_add_io_job(write_value),
                 timeout=self._operation_timeout
             )
             
             # Reset counters on successful write
             self._connection_failures = 0
             self._consecutive_timeouts = 0
+            # Entities show the written value optimistically, the next read
+            # must still come from the PLC, which may reject or clamp it
+            self._invalidate_read_cache(address)
             
-        except asyncio.TimeoutError:
+        except Exception as err:
+            await self._async_record_failure(err, f"writing {value} to {address}")
+            if isinstance(err, TimeoutError) and not str(err):
+                # asyncio.wait_for timed out
+                raise TimeoutError(f"Timeout writing to {address}") from err
+            raise
+
+    async def _async_record_failure(self, err: Exception, operation: str) -> None:
+        """Count a failed PLC operation, forcing a reconnect after too many timeouts."""
+        self._connection_failures += 1
+        if isinstance(err, TimeoutError):
             self._consecutive_timeouts += 1
-            self._connection_failures += 1
-            _LOGGER.warning("Write timeout for %s (timeout %d/%d, failure %d/%d)", 
-                          address, self._consecutive_timeouts, self._max_consecutive_timeouts,
-                          self._connection_failures, self._max_failures_before_reconnect)
+            _LOGGER.warning("Timeout %s (timeout %d/%d, failure %d/%d): %s", 
+                          operation, self._consecutive_timeouts, self._max_consecutive_timeouts,
+                          self._connection_failures, self._max_failures_before_reconnect, err)
             
             # Force reconnection after too many consecutive timeouts
             if self._consecutive_timeouts >= self._max_consecutive_timeouts:
                 _LOGGER.error("Too many consecutive timeouts, forcing reconnection")
                 self._connected = False
                 await self._async_disconnect()
-            
-            raise Exception(f"Timeout writing to {address}")
-            
-        except TimeoutError as err:
-            self._consecutive_timeouts += 1
-            self._connection_failures += 1
-            _LOGGER.warning("ADS timeout writing to %s: %s (timeout %d/%d)", 
-                          address, err, self._consecutive_timeouts, self._max_consecutive_timeouts)
-            
-            if self._consecutive_timeouts >= self._max_consecutive_timeouts:
-                _LOGGER.error("Too many consecutive timeouts, forcing reconnection")
-                self._connected = False
-                await self._async_disconnect()
-            
-            raise
-            
-        except Exception as err:
-            # Increment failure count but don't immediately disconnect
-            self._connection_failures += 1
-            _LOGGER.debug("Failed to write %s to %s (failure %d/%d): %s", 
-                         value, address, self._connection_failures, 
-                         self._max_failures_before_reconnect, err)
-            
-            # Only trigger reconnection after multiple failures
-            if self._connection_failures >= self._max_failures_before_reconnect:
-                _LOGGER.warning("Multiple write failures, will test connection")
-            
-            raise
\ No newline at end of file
+            return
+        
+        # Don't immediately disconnect, only trigger a connection test after
+        # multiple failures
+        _LOGGER.debug("Failed %s (failure %d/%d): %s", 
+                     operation, self._connection_failures, 
+                     self._max_failures_before_reconnect, err)
+        if self._connection_failures >= self._max_failures_before_reconnect:
+            _LOGGER.warning("Multiple PLC failures, will test connection")
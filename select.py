@@ -12,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity import BeckhoffADSEntity
-from .hub import BeckhoffADSHub
+from .hub import PLC_ERRORS, BeckhoffADSHub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,11 +24,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up select entities from config entry."""
     hub: BeckhoffADSHub = hass.data[DOMAIN][config_entry.entry_id]
+    hub.async_register_platform("select", BeckhoffADSSelect, async_add_entities)
     
-    entities = []
-    for entity_config in hub.entities_config:
-        if entity_config.get("type") == "select":
-            entities.append(BeckhoffADSSelect(hub, entity_config))
+    entities = [
+        BeckhoffADSSelect(hub, entity_config)
+        for entity_config in hub.configs_for("select")
+    ]
     
     async_add_entities(entities)
 
@@ -42,6 +43,11 @@ class BeckhoffADSSelect(BeckhoffADSEntity, SelectEntity):
         self._attr_options = config.get("options", [])
         if not self._attr_options:
             _LOGGER.warning("Select entity %s has no options defined", self._attr_name)
+        # Lookup tables between PLC enum values and option strings
+        self._option_by_index = tuple(self._attr_options)
+        self._index_by_option = {
+            option: index for index, option in enumerate(self._attr_options)
+        }
 
     def _get_plc_type(self) -> type:
         """Get PLC type for notifications."""
@@ -50,59 +56,30 @@ class BeckhoffADSSelect(BeckhoffADSEntity, SelectEntity):
     def _process_notification_value(self, value: Any) -> None:
         """Process notification value."""
         # Convert enum value to option string
-        if 0 <= value < len(self._attr_options):
-            self._attr_current_option = self._attr_options[value]
+        if 0 <= value < len(self._option_by_index):
+            self._attr_current_option = self._option_by_index[value]
         else:
             _LOGGER.warning(
                 "Invalid enum value %s for %s, expected 0-%s",
-                value, self.entity_id, len(self._attr_options) - 1
+                value, self.entity_id, len(self._option_by_index) - 1
             )
             self._attr_current_option = None
 
-    async def async_update(self) -> None:
-        """Update the select entity."""
-        if not self._hub.connected:
-            self._attr_available = False
-            return
-
-        try:
-            # Read as integer (enum value)
-            value = await self._hub.async_read_value(
-                self._plc_address, pyads.PLCTYPE_INT
-            )
-            
-            # Convert enum value to option string
-            if 0 <= value < len(self._attr_options):
-                self._attr_current_option = self._attr_options[value]
-            else:
-                _LOGGER.warning(
-                    "Invalid enum value %s for %s, expected 0-%s",
-                    value, self.entity_id, len(self._attr_options) - 1
-                )
-                self._attr_current_option = None
-                
-            self._attr_available = True
-            
-        except Exception as err:
-            # Don't log every error, only when availability changes
-            if self._attr_available:
-                _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
-            self._attr_available = False
-
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        if option not in self._attr_options:
+        # Convert option string to enum value
+        enum_value = self._index_by_option.get(option)
+        if enum_value is None:
             _LOGGER.error("Invalid option %s for %s", option, self.entity_id)
             return
             
         try:
-            # Convert option string to enum value
-            enum_value = self._attr_options.index(option)
             await self._hub.async_write_value(
                 self._plc_address, enum_value, pyads.PLCTYPE_INT
             )
-            self._attr_current_option = option
-            self.async_write_ha_state()
-            
-        except Exception as err:
-            _LOGGER.error("Failed to set option %s for %s: %s", option, self.entity_id, err)
\ No newline at end of file
+        except PLC_ERRORS as err:
+            _LOGGER.error("Failed to set option %s for %s: %s", option, self.entity_id, err)
+            return
+        
+        self._attr_current_option = option
+        self.async_write_ha_state()
\ No newline at end of file
@@ -4,17 +4,39 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+import pyads
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
-from .entity import BeckhoffADSEntity
+from .entity import BeckhoffADSEntity, build_scaler
 from .hub import BeckhoffADSHub
 
 _LOGGER = logging.getLogger(__name__)
 
+# PLC data types supported by sensors
+PLC_TYPE_MAPPING = {
+    "BOOL": pyads.PLCTYPE_BOOL,
+    "BYTE": pyads.PLCTYPE_BYTE,
+    "SINT": pyads.PLCTYPE_SINT,
+    "USINT": pyads.PLCTYPE_USINT,
+    "INT": pyads.PLCTYPE_INT,
+    "UINT": pyads.PLCTYPE_UINT,
+    "WORD": pyads.PLCTYPE_WORD,
+    "DINT": pyads.PLCTYPE_DINT,
+    "UDINT": pyads.PLCTYPE_UDINT,
+    "DWORD": pyads.PLCTYPE_DWORD,
+    "REAL": pyads.PLCTYPE_REAL,
+    "LREAL": pyads.PLCTYPE_LREAL,
+    "STRING": pyads.PLCTYPE_STRING,
+    "TIME": pyads.PLCTYPE_TIME,
+    "DATE": pyads.PLCTYPE_DATE,
+    "DT": pyads.PLCTYPE_DT,
+    "TOD": pyads.PLCTYPE_TOD,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -23,11 +45,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up sensor entities from config entry."""
     hub: BeckhoffADSHub = hass.data[DOMAIN][config_entry.entry_id]
+    hub.async_register_platform("sensor", BeckhoffADSSensor, async_add_entities)
     
-    entities = []
-    for entity_config in hub.entities_config:
-        if entity_config.get("type") == "sensor":
-            entities.append(BeckhoffADSSensor(hub, entity_config))
+    entities = [
+        BeckhoffADSSensor(hub, entity_config)
+        for entity_config in hub.configs_for("sensor")
+    ]
     
     async_add_entities(entities)
 
@@ -38,14 +61,28 @@ class BeckhoffADSSensor(BeckhoffADSEntity, SensorEntity):
     def __init__(self, hub: BeckhoffADSHub, config: dict[str, Any]) -> None:
         """Initialize the sensor."""
         super().__init__(hub, config)
-        self._attr_native_unit_of_measurement = config.get("unit_of_measurement")
-        self._attr_device_class = config.get("device_class")
-        self._plc_type_name = config.get("plc_type", "REAL")
+        get = config.get
+        self._attr_native_unit_of_measurement = get("unit_of_measurement")
+        self._attr_device_class = get("device_class")
+        self._plc_type_name = get("plc_type", "REAL")
+        self._plc_type = PLC_TYPE_MAPPING.get(self._plc_type_name, pyads.PLCTYPE_REAL)
         
         # Scaling and formatting options
-        self._factor = config.get("factor", 1.0)
-        self._offset = config.get("offset", 0.0)
-        self._precision = config.get("precision", None)
+        self._factor = get("factor", 1.0)
+        self._offset = get("offset", 0.0)
+        self._precision = get("precision", None)
+        
+        # Numeric values always convert, only STRING values need the checked
+        # scaling
+        if self._plc_type is pyads.PLCTYPE_STRING:
+            self._scale = self._apply_scaling
+        else:
+            self._scale = build_scaler(
+                self._factor,
+                self._offset,
+                self._precision,
+                self._plc_type in (pyads.PLCTYPE_REAL, pyads.PLCTYPE_LREAL),
+            )
 
     def _apply_scaling(self, raw_value: Any) -> float:
         """Apply scaling factor and offset to raw PLC value."""
@@ -64,51 +101,8 @@ class BeckhoffADSSensor(BeckhoffADSEntity, SensorEntity):
 
     def _get_plc_type(self) -> type:
         """Get PLC type for notifications based on configuration."""
-        import pyads
-        type_mapping = {
-            "BOOL": pyads.PLCTYPE_BOOL,
-            "BYTE": pyads.PLCTYPE_BYTE,
-            "SINT": pyads.PLCTYPE_SINT,
-            "USINT": pyads.PLCTYPE_USINT,
-            "INT": pyads.PLCTYPE_INT,
-            "UINT": pyads.PLCTYPE_UINT,
-            "WORD": pyads.PLCTYPE_WORD,
-            "DINT": pyads.PLCTYPE_DINT,
-            "UDINT": pyads.PLCTYPE_UDINT,
-            "DWORD": pyads.PLCTYPE_DWORD,
-            "REAL": pyads.PLCTYPE_REAL,
-            "LREAL": pyads.PLCTYPE_LREAL,
-            "STRING": pyads.PLCTYPE_STRING,
-            "TIME": pyads.PLCTYPE_TIME,
-            "DATE": pyads.PLCTYPE_DATE,
-            "DT": pyads.PLCTYPE_DT,
-            "TOD": pyads.PLCTYPE_TOD,
-        }
-        return type_mapping.get(self._plc_type_name, pyads.PLCTYPE_REAL)
+        return self._plc_type
 
     def _process_notification_value(self, value: Any) -> None:
         """Process notification value with scaling."""
-        scaled_value = self._apply_scaling(value)
-        self._attr_native_value = scaled_value
-
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        if not self._hub.connected:
-            self._attr_available = False
-            return
-
-        try:
-            # Use the configured PLC type for reading
-            raw_value = await self._hub.async_read_value(
-                self._plc_address, self._get_plc_type()
-            )
-            # Apply scaling to the raw value
-            scaled_value = self._apply_scaling(raw_value)
-            self._attr_native_value = scaled_value
-            self._attr_available = True
-            
-        except Exception as err:
-            # Don't log every error, only when availability changes
-            if self._attr_available:
-                _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
-            self._attr_available = False
\ No newline at end of file
+        self._attr_native_value = self._scale(value)
@@ -12,7 +12,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import DOMAIN
 from .entity import BeckhoffADSEntity
-from .hub import BeckhoffADSHub
+from .hub import PLC_ERRORS, BeckhoffADSHub
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,11 +24,12 @@ async def async_setup_entry(
 ) -> None:
     """Set up switch entities from config entry."""
     hub: BeckhoffADSHub = hass.data[DOMAIN][config_entry.entry_id]
+    hub.async_register_platform("switch", BeckhoffADSSwitch, async_add_entities)
     
-    entities = []
-    for entity_config in hub.entities_config:
-        if entity_config.get("type") == "switch":
-            entities.append(BeckhoffADSSwitch(hub, entity_config))
+    entities = [
+        BeckhoffADSSwitch(hub, entity_config)
+        for entity_config in hub.configs_for("switch")
+    ]
     
     async_add_entities(entities)
 
@@ -48,36 +49,18 @@ class BeckhoffADSSwitch(BeckhoffADSEntity, SwitchEntity):
         """Process notification value."""
         self._attr_is_on = bool(value)
 
-    async def async_update(self) -> None:
-        """Update the switch."""
-        if not self._hub.connected:
-            self._attr_available = False
-            return
-
-        try:
-            value = await self._hub.async_read_value(
-                self._plc_address, pyads.PLCTYPE_BOOL
-            )
-            self._attr_is_on = bool(value)
-            self._attr_available = True
-            
-        except Exception as err:
-            # Don't log every error, only when availability changes
-            if self._attr_available:
-                _LOGGER.warning("Failed to update %s: %s", self.entity_id, err)
-            self._attr_available = False
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
             await self._hub.async_write_value(
                 self._plc_address, True, pyads.PLCTYPE_BOOL
             )
-            self._attr_is_on = True
-            self.async_write_ha_state()
-            
-        except Exception as err:
+        except PLC_ERRORS as err:
             _LOGGER.error("Failed to turn on %s: %s", self.entity_id, err)
+            return
+        
+        self._attr_is_on = True
+        self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
@@ -85,8 +68,9 @@ class BeckhoffADSSwitch(BeckhoffADSEntity, SwitchEntity):
             await self._hub.async_write_value(
                 self._plc_address, False, pyads.PLCTYPE_BOOL
             )
-            self._attr_is_on = False
-            self.async_write_ha_state()
-            
-        except Exception as err:
-            _LOGGER.error("Failed to turn off %s: %s", self.entity_id, err)
\ No newline at end of file
+        except PLC_ERRORS as err:
+            _LOGGER.error("Failed to turn off %s: %s", self.entity_id, err)
+            return
+        
+        self._attr_is_on = False
+        self.async_write_ha_state()
\ No newline at end of file